@@ -1,6 +1,9 @@
 """Analyzer for detecting emotion tag leakage in transcriptions."""
 
-import re
+
+def _is_word_char(char: str) -> bool:
+    """Check if a character counts as part of a word (same as regex \\w)."""
+    return char.isalnum() or char == "_"
 
 
 def contains_emotion_tag(transcription: str, emotion: str) -> bool:
@@ -20,15 +23,30 @@ def contains_emotion_tag(transcription: str, emotion: str) -> bool:
     text_lower = transcription.lower()
     emotion_lower = emotion.lower()
 
-    # Check for various forms the emotion might appear:
-    # 1. With parentheses: (happy)
-    if f"({emotion_lower})" in text_lower:
-        return True
-
-    # 2. As a standalone word with word boundaries
-    # Use regex to match the emotion as a complete word
-    pattern = r"\b" + re.escape(emotion_lower) + r"\b"
-    if re.search(pattern, text_lower):
-        return True
+    # Look for the emotion as a standalone word, i.e. not surrounded by word
+    # characters. This also covers the parenthesized form: (happy)
+    n = len(emotion_lower)
+    end = len(text_lower)
+    i = text_lower.find(emotion_lower)
+    while i != -1:
+        left_ok = i == 0 or not _is_word_char(text_lower[i - 1])
+        right_ok = i + n == end or not _is_word_char(text_lower[i + n])
+        if left_ok and right_ok:
+            return True
+        i = text_lower.find(emotion_lower, i + 1)
 
     return False
+
+
+def contains_emotion_tag_batch(pairs: list[tuple[str, str]]) -> list[bool]:
+    """Check many (transcription, emotion) pairs for emotion tag leakage.
+
+    Args:
+        pairs: List of (transcription, emotion) pairs
+
+    Returns:
+        List of booleans, True where the emotion tag is found in its transcription
+    """
+    return [
+        contains_emotion_tag(transcription, emotion) for transcription, emotion in pairs
+    ]
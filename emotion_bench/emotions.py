@@ -1,8 +1,58 @@
 """Emotion registry with all Fish Audio supported emotions and contextual test phrases."""
 
+import os
+import pickle
+import tempfile
 from pathlib import Path
+
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed copy of emotions.yaml, invalidated when the YAML file changes
+_EMOTIONS_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "emotions.pkl"
+
+
+def _load_yaml_cached(yaml_path: Path) -> dict:
+    """Load a YAML file, reusing a pickled copy if the file is unchanged.
+
+    The pickle is keyed on the YAML file's mtime and size, so editing the
+    YAML invalidates it automatically.
+    """
+    stat = yaml_path.stat()
+    key = f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    try:
+        with open(_EMOTIONS_CACHE_PATH, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    with open(yaml_path, "r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Write to a temp file and rename so concurrent workers never read a
+    # partial pickle; failing to cache is not fatal
+    try:
+        _EMOTIONS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=_EMOTIONS_CACHE_PATH.parent, suffix=".tmp")
+    except OSError:
+        return data
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, data), f)
+        os.replace(tmp_name, _EMOTIONS_CACHE_PATH)
+    except (OSError, pickle.PickleError):
+        os.unlink(tmp_name)
+
+    return data
+
 
 def _load_emotions() -> tuple[dict[str, list[str]], dict[str, str]]:
     """Load emotions from YAML file.
@@ -11,8 +61,7 @@ def _load_emotions() -> tuple[dict[str, list[str]], dict[str, str]]:
         Tuple of (all_emotions dict, emotion_to_category mapping)
     """
     yaml_path = Path(__file__).parent.parent / "emotions.yaml"
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml_cached(yaml_path)
 
     all_emotions = {}
     emotion_to_category = {}
@@ -35,21 +84,65 @@ def _load_emotions() -> tuple[dict[str, list[str]], dict[str, str]]:
     return all_emotions, emotion_to_category
 
 
+def format_tts_text(emotion: str, phrase: str) -> str:
+    """Format a phrase with its emotion tag as it will be sent to TTS."""
+    return f"({emotion}) {phrase}"
+
+
+def _build_cases() -> list[tuple[str, str, int, str, str, bytes]]:
+    """Build all test cases with their TTS text and its UTF-8 encoding."""
+    cases = []
+    for emotion, phrases in ALL_EMOTIONS.items():
+        category = EMOTION_CATEGORIES.get(emotion, "unknown")
+        for idx, phrase in enumerate(phrases, 1):
+            text_with_emotion = format_tts_text(emotion, phrase)
+            cases.append(
+                (
+                    emotion,
+                    phrase,
+                    idx,
+                    category,
+                    text_with_emotion,
+                    text_with_emotion.encode("utf-8"),
+                )
+            )
+    return cases
+
+
+def _group_cases_by_emotion(
+    cases: list[tuple[str, str, int, str, str, bytes]],
+) -> dict[str, list[tuple[str, str, int, str, str, bytes]]]:
+    """Group test cases by their emotion tag, keeping their order."""
+    cases_by_emotion = {}
+    for case in cases:
+        cases_by_emotion.setdefault(case[0], []).append(case)
+    return cases_by_emotion
+
+
 # Load emotions from YAML file
 ALL_EMOTIONS, EMOTION_CATEGORIES = _load_emotions()
 
+# All test cases as (emotion_tag, test_phrase, phrase_index, category,
+# text_with_emotion, utf8_bytes) tuples, built once at import
+ALL_CASES = _build_cases()
+
+# Test cases grouped by emotion tag
+_CASES_BY_EMOTION = _group_cases_by_emotion(ALL_CASES)
+
 
 def get_all_emotions() -> list[tuple[str, str, int, str]]:
     """Get all emotions as a list of (emotion_tag, test_phrase, phrase_index, category) tuples.
 
     Returns one tuple for each phrase in each emotion's list.
     """
-    emotion_phrases = []
-    for emotion, phrases in ALL_EMOTIONS.items():
-        category = EMOTION_CATEGORIES.get(emotion, "unknown")
-        for idx, phrase in enumerate(phrases, 1):
-            emotion_phrases.append((emotion, phrase, idx, category))
-    return emotion_phrases
+    return [case[:4] for case in ALL_CASES]
+
+
+def get_emotion_cases(emotion: str) -> list[tuple[str, str, int, str, str, bytes]]:
+    """Get all test cases (in ALL_CASES form) for a specific emotion."""
+    if emotion not in _CASES_BY_EMOTION:
+        raise ValueError(f"Unknown emotion: {emotion}")
+    return _CASES_BY_EMOTION[emotion]
 
 
 def get_emotion_phrases(emotion: str) -> list[str]:
@@ -1,10 +1,103 @@
 """Fish Audio TTS client wrapper."""
 
+import functools
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
 from fishaudio import FishAudio
 
+# Directory for cached TTS audio, keyed by content hash
+TTS_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "tts"
+
+
+def is_tts_cache_enabled() -> bool:
+    """Check whether the TTS audio cache is enabled via environment variable."""
+    return os.getenv("EMOTION_BENCH_TTS_CACHE") == "1"
+
+
+def _tts_cache_path(
+    text: str, reference_id: str | None, model: str, run_number: int
+) -> Path:
+    """Get the cache file path for a TTS request."""
+    key = hashlib.sha256(
+        f"{model}|{reference_id}|{run_number}|{text}".encode()
+    ).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
+
+
+def _cached_tts(func):
+    """Cache generated audio on disk when EMOTION_BENCH_TTS_CACHE=1 is set.
+
+    The run number is part of the cache key, so each run of a phrase keeps
+    its own audio sample across benchmark invocations.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        client: FishAudio,
+        text: str,
+        reference_id: str | None = None,
+        model: str = "s1",
+        run_number: int = 1,
+    ) -> Iterator[bytes]:
+        if not is_tts_cache_enabled():
+            yield from func(client, text, reference_id, model, run_number)
+            return
+
+        cache_path = _tts_cache_path(text, reference_id, model, run_number)
+        if cache_path.exists():
+            yield cache_path.read_bytes()
+            return
+
+        # Stream chunks to a temp file and rename once complete, so readers
+        # never see partial audio
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in func(client, text, reference_id, model, run_number):
+                    f.write(chunk)
+                    yield chunk
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    return wrapper
+
+
+@_cached_tts
+def stream_speech(
+    client: FishAudio,
+    text: str,
+    reference_id: str | None = None,
+    model: str = "s1",
+    run_number: int = 1,
+) -> Iterator[bytes]:
+    """Stream speech from text using Fish Audio TTS.
+
+    Args:
+        client: FishAudio client instance
+        text: Text to convert to speech (can include emotion tags like "(happy) Hello!")
+        reference_id: Optional voice model ID to use
+        model: TTS model to use (s1, speech-1.6, speech-1.5). Defaults to s1.
+        run_number: Benchmark run this audio is for; only used to key the TTS cache
+
+    Yields:
+        Audio chunks in MP3 format as they arrive
+    """
+    yield from client.tts.stream(text=text, reference_id=reference_id, model=model)
+
 
 def generate_speech(
-    client: FishAudio, text: str, reference_id: str | None = None, model: str = "s1"
+    client: FishAudio,
+    text: str,
+    reference_id: str | None = None,
+    model: str = "s1",
+    run_number: int = 1,
 ) -> bytes:
     """Generate speech from text using Fish Audio TTS.
 
@@ -13,13 +106,19 @@ def generate_speech(
         text: Text to convert to speech (can include emotion tags like "(happy) Hello!")
         reference_id: Optional voice model ID to use
         model: TTS model to use (s1, speech-1.6, speech-1.5). Defaults to s1.
+        run_number: Benchmark run this audio is for; only used to key the TTS cache
 
     Returns:
         Audio bytes in MP3 format
     """
-    # Collect all audio chunks
-    audio_buffer = bytearray()
-    for chunk in client.tts.convert(text=text, reference_id=reference_id, model=model):
-        audio_buffer.extend(chunk)
-
-    return bytes(audio_buffer)
+    # Collect all audio chunks and concatenate them in one copy
+    chunks = list(
+        stream_speech(
+            client=client,
+            text=text,
+            reference_id=reference_id,
+            model=model,
+            run_number=run_number,
+        )
+    )
+    return b"".join(chunks)
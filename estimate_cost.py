@@ -3,14 +3,13 @@
 import math
 import os
 
-from scipy import stats
-
-from emotion_bench.emotions import get_all_emotions
+from emotion_bench.emotions import ALL_CASES
 from emotion_bench.reference_voices import get_reference_ids
 
 # Statistical constants
-Z_SCORE_95 = stats.norm.ppf(0.975)  # 95% confidence interval
-Z_SCORE_99 = stats.norm.ppf(0.995)  # 99% confidence interval
+# Two-sided z-scores, i.e. the standard normal quantiles at 0.975 and 0.995
+Z_SCORE_95 = 1.959963984540054  # 95% confidence interval
+Z_SCORE_99 = 2.5758293035489004  # 99% confidence interval
 WORST_CASE_PROPORTION = 0.5  # Maximum variance for margin of error
 
 # Cost constants
@@ -41,25 +40,21 @@ def calculate_confidence_intervals(sample_size: float) -> tuple[float, float]:
 def estimate_cost():
     """Calculate total characters and estimated cost for benchmark."""
 
-    # Get all test cases
-    emotion_phrases = get_all_emotions()
+    # Get voices to test
     reference_ids = get_reference_ids()
 
-    # Group by emotion and calculate
+    # Group by emotion and calculate (TTS text and UTF-8 bytes are precomputed)
     emotion_breakdown = {}
     total_chars = 0
     total_bytes = 0
 
-    for emotion, phrase, phrase_idx, _ in emotion_phrases:
+    for emotion, _, phrase_idx, _, text_with_emotion, text_bytes in ALL_CASES:
         if emotion not in emotion_breakdown:
             emotion_breakdown[emotion] = []
 
-        # Format text as it will be sent to TTS
-        text_with_emotion = f"({emotion}) {phrase}"
-
         # Count characters and UTF-8 bytes
         chars = len(text_with_emotion)
-        bytes_count = len(text_with_emotion.encode("utf-8"))
+        bytes_count = len(text_bytes)
 
         emotion_breakdown[emotion].append(
             {
@@ -78,7 +73,7 @@ def estimate_cost():
     num_voices = len(reference_ids)
 
     # Multiply by voices and runs
-    total_api_calls = len(emotion_phrases) * num_voices * num_runs
+    total_api_calls = len(ALL_CASES) * num_voices * num_runs
 
     # Calculate cost
     estimated_cost = (
@@ -87,7 +82,7 @@ def estimate_cost():
 
     # Calculate actual phrases per emotion
     num_emotions = len(emotion_breakdown)
-    phrases_per_emotion = len(emotion_phrases) / num_emotions if num_emotions > 0 else 0
+    phrases_per_emotion = len(ALL_CASES) / num_emotions if num_emotions > 0 else 0
 
     # Calculate statistical confidence intervals
     sample_size_per_emotion = phrases_per_emotion * num_runs * num_voices
@@ -109,9 +104,9 @@ def estimate_cost():
     print(f"Margin of error (95% CI): ±{margin_error_95 * 100:.1f}%")
     print(f"Margin of error (99% CI): ±{margin_error_99 * 100:.1f}%")
     print()
-    print(f"Base test cases: {len(emotion_phrases)}")
+    print(f"Base test cases: {len(ALL_CASES)}")
     print(
-        f"Total TTS calls: {total_api_calls:,} ({len(emotion_phrases)} × {num_voices} voices × {num_runs} runs)"
+        f"Total TTS calls: {total_api_calls:,} ({len(ALL_CASES)} × {num_voices} voices × {num_runs} runs)"
     )
     print()
     print(f"Characters per run: {total_chars:,}")
@@ -1,33 +1,36 @@
 """Collect and aggregate benchmark results."""
 
-from dataclasses import dataclass
+import heapq
+from collections import Counter
 from pathlib import Path
-import json
-from tabulate import tabulate
 
 from tests.test_emotions import get_model
 
 
-@dataclass
-class BenchmarkResult:
-    """Single benchmark result for one phrase test."""
-
-    emotion: str
-    voice: str
-    phrase_idx: int
-    phrase: str
-    run_number: int
-    category: str
-    status: str  # PASS, FAIL, or ERROR
-    transcription: str | None
-    error: str | None
+# Index of each status in per-emotion [pass, fail, error] counters
+_STATUS_INDEX = {"PASS": 0, "FAIL": 1, "ERROR": 2}
 
 
 class BenchmarkCollector:
-    """Collect benchmark results across all tests."""
+    """Collect benchmark results across all tests.
+
+    Results are stored column-wise, one list per field, so aggregation can
+    walk only the columns it needs.
+    """
 
     def __init__(self):
-        self.results: list[BenchmarkResult] = []
+        self.emotion: list[str] = []
+        self.voice: list[str] = []
+        self.phrase_idx: list[int] = []
+        self.phrase: list[str] = []
+        self.run_number: list[int] = []
+        self.category: list[str] = []
+        self.status: list[str] = []  # PASS, FAIL, or ERROR
+        self.transcription: list[str | None] = []
+        self.error: list[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self.status)
 
     def add_result(
         self,
@@ -42,80 +45,127 @@ class BenchmarkCollector:
         error: str | None,
     ):
         """Add a benchmark result."""
-        self.results.append(
-            BenchmarkResult(
-                emotion=emotion,
-                voice=voice,
-                phrase_idx=phrase_idx,
-                phrase=phrase,
-                run_number=run_number,
-                category=category,
-                status=status,
-                transcription=transcription,
-                error=error,
+        self.emotion.append(emotion)
+        self.voice.append(voice)
+        self.phrase_idx.append(phrase_idx)
+        self.phrase.append(phrase)
+        self.run_number.append(run_number)
+        self.category.append(category)
+        self.status.append(status)
+        self.transcription.append(transcription)
+        self.error.append(error)
+
+    def to_records(self) -> list[dict]:
+        """Get all results as a list of per-result dicts."""
+        return [
+            {
+                "emotion": emotion,
+                "voice": voice,
+                "phrase_idx": phrase_idx,
+                "phrase": phrase,
+                "run_number": run_number,
+                "category": category,
+                "status": status,
+                "transcription": transcription,
+                "error": error,
+            }
+            for (
+                emotion,
+                voice,
+                phrase_idx,
+                phrase,
+                run_number,
+                category,
+                status,
+                transcription,
+                error,
+            ) in zip(
+                self.emotion,
+                self.voice,
+                self.phrase_idx,
+                self.phrase,
+                self.run_number,
+                self.category,
+                self.status,
+                self.transcription,
+                self.error,
             )
-        )
+        ]
 
     def save_results(self, output_file: str = "benchmark_results.json"):
         """Save results to JSON file."""
         data = {
             "model": get_model(),
-            "results": [
-                {
-                    "emotion": r.emotion,
-                    "voice": r.voice,
-                    "phrase_idx": r.phrase_idx,
-                    "phrase": r.phrase,
-                    "run_number": r.run_number,
-                    "category": r.category,
-                    "status": r.status,
-                    "transcription": r.transcription,
-                    "error": r.error,
-                }
-                for r in self.results
-            ],
+            "results": self.to_records(),
             "summary": self.get_summary(),
         }
 
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+
+        # Serializers are imported here since only the controller saves results
+        try:
+            import orjson
+        except ImportError:
+            import json
+
+            with open(output_path, "w") as f:
+                json.dump(data, f, indent=2)
+        else:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         print(f"\nBenchmark results saved to: {output_path.absolute()}")
 
+    def _group_by_emotion(self) -> dict[str, tuple[str, str, list[int]]]:
+        """Group results by emotion in a single pass.
+
+        Returns:
+            Mapping of emotion to (category, voice, [pass, fail, error]), where
+            category and voice are taken from the emotion's first result
+        """
+        emotion_groups = {}
+        for emotion, category, voice, status in zip(
+            self.emotion, self.category, self.voice, self.status
+        ):
+            if emotion not in emotion_groups:
+                emotion_groups[emotion] = (category, voice, [0, 0, 0])
+            emotion_groups[emotion][2][_STATUS_INDEX[status]] += 1
+        return emotion_groups
+
     def get_summary(self) -> dict:
         """Get summary statistics."""
-        if not self.results:
+        return self._build_summary(self._group_by_emotion())
+
+    def _build_summary(
+        self, emotion_groups: dict[str, tuple[str, str, list[int]]]
+    ) -> dict:
+        """Build summary statistics from already grouped results."""
+        if not self.status:
             return {}
 
-        total_tests = len(self.results)
-        pass_count = sum(1 for r in self.results if r.status == "PASS")
-        fail_count = sum(1 for r in self.results if r.status == "FAIL")
-        error_count = sum(1 for r in self.results if r.status == "ERROR")
+        total_tests = len(self.status)
+        status_counts = Counter(self.status)
+        pass_count = status_counts["PASS"]
+        fail_count = status_counts["FAIL"]
+        error_count = status_counts["ERROR"]
 
         success_rate = (pass_count / total_tests * 100) if total_tests > 0 else 0
 
-        # Group by emotion
-        emotion_stats = {}
-        for result in self.results:
-            if result.emotion not in emotion_stats:
-                emotion_stats[result.emotion] = {"pass": 0, "fail": 0, "error": 0}
-            emotion_stats[result.emotion][result.status.lower()] += 1
-
         # Calculate success rate per emotion
         emotion_success_rates = {}
-        for emotion, stats in emotion_stats.items():
-            total = stats["pass"] + stats["fail"] + stats["error"]
+        for emotion, (_, _, stats) in emotion_groups.items():
+            total = sum(stats)
             emotion_success_rates[emotion] = (
-                (stats["pass"] / total * 100) if total > 0 else 0
+                (stats[0] / total * 100) if total > 0 else 0
             )
 
-        # Find best and worst
-        best_emotions = sorted(
-            emotion_success_rates.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-        worst_emotions = sorted(emotion_success_rates.items(), key=lambda x: x[1])[:5]
+        # Find best and worst (same order as a full stable sort, without sorting)
+        best_emotions = heapq.nlargest(
+            5, emotion_success_rates.items(), key=lambda x: x[1]
+        )
+        worst_emotions = heapq.nsmallest(
+            5, emotion_success_rates.items(), key=lambda x: x[1]
+        )
 
         return {
             "total_tests": total_tests,
@@ -133,10 +183,13 @@ class BenchmarkCollector:
 
     def save_markdown_summary(self, output_file: str = "output/summary.md"):
         """Save summary as markdown file."""
-        if not self.results:
+        if not self.status:
             return
 
-        summary = self.get_summary()
+        from tabulate import tabulate
+
+        emotion_groups = self._group_by_emotion()
+        summary = self._build_summary(emotion_groups)
 
         # Build markdown content
         lines = [
@@ -176,27 +229,19 @@ class BenchmarkCollector:
         # Emotion breakdown
         lines.append("## Results by Emotion\n")
 
-        # Group results by emotion
-        emotion_groups = {}
-        for result in self.results:
-            if result.emotion not in emotion_groups:
-                emotion_groups[result.emotion] = []
-            emotion_groups[result.emotion].append(result)
-
-        # Create table with pass/fail/error counts per emotion
+        # Create table with pass/fail/error counts per emotion, reusing the
+        # grouping the summary was built from
         emotion_table = []
-        for emotion, results in sorted(emotion_groups.items()):
-            pass_count = sum(1 for r in results if r.status == "PASS")
-            fail_count = sum(1 for r in results if r.status == "FAIL")
-            error_count = sum(1 for r in results if r.status == "ERROR")
-            total = len(results)
+        for emotion, (category, voice, counts) in sorted(emotion_groups.items()):
+            pass_count, fail_count, error_count = counts
+            total = sum(counts)
             success_rate = (pass_count / total * 100) if total > 0 else 0
 
             emotion_table.append(
                 [
                     emotion,
-                    results[0].category,
-                    results[0].voice,
+                    category,
+                    voice,
                     f"{success_rate:.1f}%",
                     pass_count,
                     fail_count,
@@ -1,13 +1,17 @@
 """Pytest configuration and fixtures for emotion benchmark tests."""
 
+import importlib.util
 import os
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 from fishaudio import FishAudio
 
+from emotion_bench.emotions import ALL_EMOTIONS
 from tests.benchmark_results import BenchmarkCollector
 
 # Load environment variables from .env file
@@ -16,6 +20,11 @@ load_dotenv()
 # Global collector for aggregating results from all workers
 aggregated_collector = BenchmarkCollector()
 
+# Mirror the FishAudio client's defaults, which it only applies when it
+# builds its own HTTP client
+FISH_API_BASE_URL = "https://api.fish.audio"
+FISH_API_TIMEOUT = 240.0
+
 
 def pytest_sessionstart(session):
     """Clear output directory before starting test session."""
@@ -25,14 +34,49 @@ def pytest_sessionstart(session):
     output_dir.mkdir()
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Group tests by emotion so xdist --dist=loadgroup keeps them on one worker.
+
+    Runs before xdist's own hook, which reads the markers to assign groups.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "emotion" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(name=callspec.params["emotion"]))
+
+
 @pytest.fixture(scope="session")
-def fish_client() -> FishAudio:
-    """Create a Fish Audio client instance."""
+def fish_client() -> Iterator[FishAudio]:
+    """Create a Fish Audio client instance.
+
+    The client shares one keep-alive HTTP connection pool for the whole
+    session (HTTP/2 when h2 is installed), so TLS handshakes happen once per
+    connection rather than once per request.
+    """
     api_key = os.getenv("FISH_API_KEY")
     if not api_key:
         pytest.skip("FISH_API_KEY environment variable not set")
 
-    return FishAudio(api_key=api_key)
+    http_client = httpx.Client(
+        base_url=FISH_API_BASE_URL,
+        timeout=httpx.Timeout(FISH_API_TIMEOUT),
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+    )
+    yield FishAudio(api_key=api_key, httpx_client=http_client)
+    http_client.close()
+
+
+@pytest.fixture(scope="session")
+def audio_dirs() -> dict[str, Path]:
+    """Create the audio output directory for every emotion once per session."""
+    dirs = {}
+    for emotion in ALL_EMOTIONS:
+        audio_dir = Path("output/audio") / emotion
+        audio_dir.mkdir(parents=True, exist_ok=True)
+        dirs[emotion] = audio_dir
+    return dirs
 
 
 @pytest.fixture(scope="session")
@@ -72,30 +116,19 @@ def pytest_sessionfinish(session):
         # Worker: send results to controller via workeroutput
         if hasattr(session, "_benchmark_collector"):
             collector = session._benchmark_collector
-            if collector.results:
-                session.config.workeroutput["benchmark_results"] = [
-                    {
-                        "emotion": r.emotion,
-                        "voice": r.voice,
-                        "phrase_idx": r.phrase_idx,
-                        "phrase": r.phrase,
-                        "run_number": r.run_number,
-                        "category": r.category,
-                        "status": r.status,
-                        "transcription": r.transcription,
-                        "error": r.error,
-                    }
-                    for r in collector.results
-                ]
+            if collector:
+                session.config.workeroutput["benchmark_results"] = (
+                    collector.to_records()
+                )
     else:
         # Controller: save aggregated results
-        if aggregated_collector.results:
+        if aggregated_collector:
             # Had workers - use aggregated results
             aggregated_collector.save_results("output/benchmark_results.json")
             aggregated_collector.save_markdown_summary("output/summary.md")
         elif hasattr(session, "_benchmark_collector"):
             # No workers - save from session collector
             collector = session._benchmark_collector
-            if collector.results:
+            if collector:
                 collector.save_results("output/benchmark_results.json")
                 collector.save_markdown_summary("output/summary.md")
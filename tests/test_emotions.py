@@ -1,16 +1,18 @@
 """Main benchmark tests for emotion tag leakage."""
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from fishaudio import FishAudio
 
-from emotion_bench.emotions import get_all_emotions
+from emotion_bench.emotions import ALL_EMOTIONS, get_emotion_cases
 from emotion_bench.reference_voices import get_reference_ids
 from emotion_bench.tts_client import generate_speech
 from emotion_bench.stt_client import transcribe_audio
-from emotion_bench.analyzer import contains_emotion_tag
+from emotion_bench.analyzer import contains_emotion_tag_batch
 
 
 def get_num_runs() -> int:
@@ -23,80 +25,147 @@ def get_model() -> str:
     return os.getenv("MODEL", "s1")
 
 
+def get_max_concurrency() -> int:
+    """Get the maximum number of in-flight TTS/STT runs per test from environment variable."""
+    return int(os.getenv("MAX_CONCURRENCY", "16"))
+
+
+def run_one(
+    client: FishAudio,
+    text_with_emotion: str,
+    reference_id: str | None,
+    model: str,
+    run_number: int,
+    audio_file: Path,
+) -> tuple[str | None, str | None]:
+    """Run a single TTS -> STT round-trip.
+
+    Args:
+        client: Fish Audio client instance
+        text_with_emotion: Text sent to TTS, including the emotion tag
+        reference_id: Voice model ID to use (or None for default voice)
+        model: TTS model to use
+        run_number: Run number of this phrase (1-based)
+        audio_file: Path to save the generated audio to
+
+    Returns:
+        Tuple of (transcription, error_message); transcription is None on error
+    """
+    error_message = None
+    transcription = None
+
+    try:
+        # Step 1: Generate audio using TTS
+        audio_bytes = generate_speech(
+            client=client,
+            text=text_with_emotion,
+            reference_id=reference_id,
+            model=model,
+            run_number=run_number,
+        )
+
+        # Save audio file
+        audio_file.write_bytes(audio_bytes)
+
+        # Step 2: Transcribe audio using STT
+        transcription = transcribe_audio(client=client, audio_bytes=audio_bytes)
+
+    except Exception as e:
+        error_message = str(e)
+
+    return transcription, error_message
+
+
+async def arun_one(
+    executor: ThreadPoolExecutor, *args
+) -> tuple[str | None, str | None]:
+    """Run `run_one` in a worker thread of the given executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, run_one, *args)
+
+
 @pytest.mark.parametrize("reference_id", get_reference_ids())
-@pytest.mark.parametrize("emotion,phrase,phrase_idx,category", get_all_emotions())
+@pytest.mark.parametrize("emotion", list(ALL_EMOTIONS))
 def test_emotion_benchmark(
     fish_client: FishAudio,
     benchmark_collector,
+    audio_dirs: dict[str, Path],
     reference_id: str | None,
     emotion: str,
-    phrase: str,
-    phrase_idx: int,
-    category: str,
 ):
     """Test that emotion tags do not leak into STT transcriptions.
 
     Each emotion has 10 different test phrases for comprehensive coverage.
+    All phrases and runs for the emotion are issued concurrently (up to
+    MAX_CONCURRENCY in flight) so network latency overlaps across requests.
 
     Args:
         fish_client: Fish Audio client instance
         benchmark_collector: Collector for aggregating results
+        audio_dirs: Output directory for each emotion's audio files
         reference_id: Voice model ID to use (or None for default voice)
         emotion: The emotion tag (e.g., "happy")
-        phrase: The test phrase for this emotion
-        phrase_idx: The phrase number (1-10)
-        category: The emotion category (e.g., "basic_emotions")
     """
-    text_with_emotion = f"({emotion}) {phrase}"
     voice_label = reference_id if reference_id else "default"
     num_runs = get_num_runs()
     model = get_model()
 
-    # Create output directory for this emotion
-    audio_dir = Path("output/audio") / emotion
-    audio_dir.mkdir(parents=True, exist_ok=True)
-
-    # Run the same phrase NUM_RUNS times
-    for run in range(num_runs):
-        result_status = "PASS"
-        error_message = None
-        transcription = None
-
-        try:
-            # Step 1: Generate audio using TTS
-            audio_bytes = generate_speech(
-                client=fish_client,
-                text=text_with_emotion,
-                reference_id=reference_id,
-                model=model,
-            )
+    audio_dir = audio_dirs[emotion]
 
-            # Save audio file (include run number if NUM_RUNS > 1)
+    # Build one case per (phrase, run)
+    cases = []
+    for _, phrase, phrase_idx, category, text_with_emotion, _ in get_emotion_cases(
+        emotion
+    ):
+        # Run the same phrase NUM_RUNS times
+        for run in range(num_runs):
+            # Include run number in file name if NUM_RUNS > 1
             if num_runs > 1:
                 audio_file = audio_dir / f"{voice_label}_{phrase_idx}_run{run + 1}.mp3"
             else:
                 audio_file = audio_dir / f"{voice_label}_{phrase_idx}.mp3"
 
-            with open(audio_file, "wb") as f:
-                f.write(audio_bytes)
+            cases.append(
+                (phrase, phrase_idx, category, run, text_with_emotion, audio_file)
+            )
 
-            # Step 2: Transcribe audio using STT
-            transcription = transcribe_audio(
-                client=fish_client, audio_bytes=audio_bytes
+    async def run_all() -> list[tuple[str | None, str | None]]:
+        # The executor size bounds how many runs are in flight at once
+        with ThreadPoolExecutor(max_workers=get_max_concurrency()) as executor:
+            return await asyncio.gather(
+                *(
+                    arun_one(
+                        executor,
+                        fish_client,
+                        text_with_emotion,
+                        reference_id,
+                        model,
+                        run + 1,
+                        audio_file,
+                    )
+                    for _, _, _, run, text_with_emotion, audio_file in cases
+                )
             )
 
-            # Step 3: Check if emotion tag leaked into transcription
-            tag_found = contains_emotion_tag(transcription, emotion)
+    outcomes = asyncio.run(run_all())
 
-            if tag_found:
-                result_status = "FAIL"
-                error_message = f"Tag leaked: '{transcription}'"
+    # Check if emotion tag leaked into each transcription
+    tags_found = contains_emotion_tag_batch(
+        [(transcription or "", emotion) for transcription, _ in outcomes]
+    )
 
-        except Exception as e:
+    # Add to collector (one result per run)
+    for case, (transcription, error_message), tag_found in zip(
+        cases, outcomes, tags_found
+    ):
+        phrase, phrase_idx, category, run, _, _ = case
+        if error_message is not None:
             result_status = "ERROR"
-            error_message = str(e)
-
-        # Add to collector (one result per run)
+        elif tag_found:
+            result_status = "FAIL"
+            error_message = f"Tag leaked: '{transcription}'"
+        else:
+            result_status = "PASS"
         benchmark_collector.add_result(
             emotion=emotion,
             voice=voice_label,